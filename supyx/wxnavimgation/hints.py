@@ -7,12 +7,104 @@ Inspired by Surfingkeys' hint mode:
 - Hint characters: asdfgqwertzxcvb (left-hand home row priority)
 """
 
+from itertools import product
+
 import wx
 
+from .modes import INPUT_TYPES, VimMode
+
 
 # Left-hand home row priority characters for easier typing
 HINT_CHARACTERS = "asdfgqwertzxcvb"
 
+# All one-, two- and three-character hint strings, in assignment order.
+# Single-character hints are prefixes of every longer hint, so once there are
+# more than len(HINT_CHARACTERS) hints the longer ones cannot be typed: 'a'
+# activates its widget before 'aa' is reached.
+_HINT_CACHE = tuple(
+    ''.join(chars)
+    for length in (1, 2, 3)
+    for chars in product(HINT_CHARACTERS, repeat=length)
+)
+
+# Keycode -> lowercase hint character code, 0 for keys that are not hint keys
+_KEY_TO_HINT = bytearray(256)
+for _char in HINT_CHARACTERS:
+    _KEY_TO_HINT[ord(_char)] = ord(_char)
+    _KEY_TO_HINT[ord(_char.upper())] = ord(_char)
+del _char
+
+# Reserved keys on hint trie nodes; character edges are keyed by ord(char)
+_TRIE_WIDGET = "widget"
+_TRIE_INDICES = "indices"
+
+# Widget classes hinted in 'all' mode ('input' mode uses INPUT_TYPES)
+_CLICK_TYPES = (
+    wx.Button, wx.BitmapButton, wx.ToggleButton,
+    wx.CheckBox, wx.RadioButton,
+    wx.Choice, wx.ComboBox,
+    wx.TextCtrl, wx.SearchCtrl  # Include inputs in 'all' mode too
+)
+# Controls whose children (if any) never need hints, so traversal stops there
+_LEAF_TYPES = (
+    wx.Button, wx.BitmapButton, wx.ToggleButton,
+    wx.CheckBox, wx.RadioButton, wx.Choice,
+    wx.TextCtrl, wx.SearchCtrl
+)
+
+# Shared hint colours, created lazily in show() since wx objects need a wx.App
+_HINT_BG = None
+_HINT_FG = None
+
+
+def _init_hint_style():
+    """Create the shared hint colours on first use."""
+    global _HINT_BG, _HINT_FG
+    if _HINT_BG is not None:
+        return
+    _HINT_BG = wx.Colour(254, 218, 49)  # Yellow (#feda31)
+    _HINT_FG = wx.Colour(74, 64, 14)  # Dark brown (#4a400e)
+
+
+def _make_hint_font(hint_text):
+    """Create the bold 9pt hint font from a label's default font."""
+    font = hint_text.GetFont()
+    font.PointSize = 9
+    return font.Bold()
+
+
+def _new_trie_node():
+    """Create an empty hint trie node."""
+    return {_TRIE_INDICES: set()}
+
+
+def _click_activator(widget):
+    """Generate a button click event."""
+    event = wx.CommandEvent(wx.wxEVT_COMMAND_BUTTON_CLICKED, widget.GetId())
+    event.SetEventObject(widget)
+    widget.GetEventHandler().ProcessEvent(event)
+
+
+def _checkbox_activator(widget):
+    """Toggle a checkbox and notify its handlers."""
+    widget.SetValue(not widget.GetValue())
+    event = wx.CommandEvent(wx.wxEVT_COMMAND_CHECKBOX_CLICKED, widget.GetId())
+    event.SetEventObject(widget)
+    widget.GetEventHandler().ProcessEvent(event)
+
+
+def _radio_activator(widget):
+    """Select a radio button and notify its handlers."""
+    widget.SetValue(True)
+    event = wx.CommandEvent(wx.wxEVT_COMMAND_RADIOBUTTON_SELECTED, widget.GetId())
+    event.SetEventObject(widget)
+    widget.GetEventHandler().ProcessEvent(event)
+
+
+def _focus_activator(widget):
+    """Focus the widget (inputs, lists, choices)."""
+    widget.SetFocus()
+
 
 class HintOverlay:
     """
@@ -25,6 +117,21 @@ class HintOverlay:
     Inspired by Surfingkeys' hint mode.
     """
 
+    # Activation handler per widget class. Subclasses are resolved through
+    # their MRO on first use and cached here.
+    _ACTIVATORS = {
+        wx.Button: _click_activator,
+        wx.BitmapButton: _click_activator,
+        wx.ToggleButton: _click_activator,
+        wx.CheckBox: _checkbox_activator,
+        wx.RadioButton: _radio_activator,
+        wx.TextCtrl: _focus_activator,
+        wx.ComboBox: _focus_activator,
+        wx.SearchCtrl: _focus_activator,
+        wx.ListCtrl: _focus_activator,
+        wx.Choice: _focus_activator,
+    }
+
     def __init__(self, parent):
         """
         Initialize the hint overlay.
@@ -33,10 +140,16 @@ class HintOverlay:
             parent: The parent wx.Frame or window
         """
         self.parent = parent
-        self.hints = []
+        # Hinted widgets and their hint strings, kept in lockstep
+        self._hint_widgets = []
+        self._hint_strs = []
         self.hint_windows = []
         self.current_input = ""
-        self.hint_chars = HINT_CHARACTERS
+        self._hint_trie = _new_trie_node()
+        self._trie_cursor = self._hint_trie
+        self._visible = set()
+        # Hint font, built from this parent's first hint label
+        self._hint_font = None
 
     def show(self, hint_type="all"):
         """
@@ -46,24 +159,39 @@ class HintOverlay:
             hint_type: 'input' for input fields only, 'all' for all clickable elements
         """
         self._clear_hints()
-        widgets = self._find_widgets(hint_type)
+        # Hint strings run out after _HINT_CACHE; note that hints longer than
+        # one character are already shadowed by the single-character ones
+        widgets = self._find_widgets(hint_type)[:len(_HINT_CACHE)]
 
         if not widgets:
             # No widgets found, exit hint mode
-            from .modes import VimMode
             self.parent.set_vim_mode(VimMode.DEFAULT)
             return
 
-        for i, widget in enumerate(widgets):
-            hint_str = self._generate_hint_string(i)
-            self._create_hint_window(widget, hint_str)
-            self.hints.append({
-                "widget": widget,
-                "hint": hint_str
-            })
+        _init_hint_style()
+        # Get parent's client area screen position (excludes title bar)
+        parent_origin = self.parent.ClientToScreen((0, 0))
+        # Row geometry per ListCtrl, measured once on its top visible row
+        list_geometry = {}
+
+        # Batch native window updates while the hint panels are placed
+        self.parent.Freeze()
+        try:
+            for widget, hint_str in zip(widgets, _HINT_CACHE):
+                self._create_hint_window(widget, hint_str, parent_origin, list_geometry)
+                self._hint_widgets.append(widget)
+                self._hint_strs.append(hint_str)
+        finally:
+            self.parent.Thaw()
+
+        self._hint_trie = self._build_hint_trie()
+        self._trie_cursor = self._hint_trie
+        self._visible = set(range(len(self.hint_windows)))
 
     def hide(self):
         """Hide all hint windows."""
+        if not self.hint_windows and not self.current_input:
+            return
         self._clear_hints()
         self.current_input = ""
 
@@ -71,6 +199,9 @@ class HintOverlay:
         """
         Handle key input in hint mode.
 
+        Leaving hint mode goes through parent.set_vim_mode(), which hides
+        the overlay.
+
         Args:
             keycode: The key code from wx.EVT_CHAR_HOOK
 
@@ -79,50 +210,36 @@ class HintOverlay:
         """
         # ESC is handled by modes.py now, but keep for safety
         if keycode == wx.WXK_ESCAPE:
-            self.hide()
-            from .modes import VimMode
             self.parent.set_vim_mode(VimMode.DEFAULT)
             return True
 
-        # Convert keycode to character
-        char = None
-        if 97 <= keycode <= 122:  # a-z
-            char = chr(keycode)
-        elif 65 <= keycode <= 90:  # A-Z
-            char = chr(keycode + 32)  # Convert to lowercase
+        # Map keycode to a lowercase hint character code (0 if not a hint key)
+        code = _KEY_TO_HINT[keycode] if 0 <= keycode < 256 else 0
 
         # If not a valid hint character, exit hint mode
-        if char is None or char not in self.hint_chars:
-            self.hide()
-            from .modes import VimMode
+        if not code:
             self.parent.set_vim_mode(VimMode.DEFAULT)
             return True  # Consume the key to prevent accidental typing
 
-        self.current_input += char
+        self.current_input += chr(code)
 
-        # Filter hints that match current input
-        matching_hints = [
-            h for h in self.hints
-            if h["hint"].startswith(self.current_input)
-        ]
-
-        # Check for exact match
-        for hint in matching_hints:
-            if hint["hint"] == self.current_input:
-                # Found exact match, activate the widget
-                self._activate_widget(hint["widget"])
-                self.hide()
-                from .modes import VimMode
-                self.parent.set_vim_mode(VimMode.DEFAULT)
-                return True
+        # Descend one level in the hint trie
+        node = self._trie_cursor.get(code)
 
         # If no more matches possible, exit hint mode
-        if not matching_hints:
-            self.hide()
-            from .modes import VimMode
+        if node is None:
+            self.parent.set_vim_mode(VimMode.DEFAULT)
+            return True
+
+        # Check for exact match
+        if _TRIE_WIDGET in node:
+            # Found exact match, activate the widget
+            self._activate_widget(node[_TRIE_WIDGET])
             self.parent.set_vim_mode(VimMode.DEFAULT)
             return True
 
+        self._trie_cursor = node
+
         # Update visual: hide non-matching hints
         self._update_hint_visibility()
 
@@ -141,67 +258,74 @@ class HintOverlay:
         """
         widgets = []
 
-        def traverse(widget):
+        # Iterative depth-first walk; hidden or disabled subtrees are skipped
+        stack = [self.parent]
+        while stack:
+            widget = stack.pop()
             if not widget.IsShown() or not widget.IsEnabled():
-                return
+                continue
 
             if hint_type == "input":
                 # Only input fields
-                if isinstance(widget, (wx.TextCtrl, wx.ComboBox, wx.SearchCtrl)):
+                if isinstance(widget, INPUT_TYPES):
                     widgets.append(widget)
             else:  # 'all' - clickable elements
                 if isinstance(widget, wx.ListCtrl):
                     # Add individual list items instead of the whole ListCtrl
                     item_count = widget.GetItemCount()
-                    for i in range(item_count):
+                    if not item_count:
+                        first, last = 0, 0
+                    elif widget.InReportView():
+                        # Only rows scrolled into view can be hinted; the
+                        # extra row covers a partly visible one at the bottom
+                        first = max(widget.GetTopItem(), 0)
+                        last = min(first + widget.GetCountPerPage() + 1, item_count)
+                    else:
+                        first, last = 0, item_count
+                    for i in range(first, last):
                         widgets.append((widget, i))  # Tuple: (ListCtrl, item_index)
-                elif isinstance(widget, (
-                    wx.Button, wx.BitmapButton, wx.ToggleButton,
-                    wx.CheckBox, wx.RadioButton,
-                    wx.Choice, wx.ComboBox,
-                    wx.TextCtrl, wx.SearchCtrl  # Include inputs in 'all' mode too
-                )):
+                elif isinstance(widget, _CLICK_TYPES):
                     widgets.append(widget)
 
-            # Traverse children
-            for child in widget.GetChildren():
-                traverse(child)
+            if isinstance(widget, _LEAF_TYPES):
+                continue
+
+            # Push children reversed so they are visited in window order
+            stack.extend(reversed(widget.GetChildren()))
 
-        traverse(self.parent)
         return widgets
 
-    def _generate_hint_string(self, index):
+    def _build_hint_trie(self):
         """
-        Generate a hint string for the given index.
-
-        Uses single characters for first N elements (where N = len(hint_chars)),
-        then two-character combinations for more elements.
+        Build a prefix trie over the current hint strings.
 
-        Args:
-            index: The index of the element
+        Each node maps ord(char) to a child node, keeps the indices of all
+        hints below it under _TRIE_INDICES, and stores the widget of a
+        complete hint under _TRIE_WIDGET.
 
         Returns:
-            A hint string like 'a', 's', 'd', or 'aa', 'as', etc.
+            The root node of the trie
         """
-        chars = self.hint_chars
-        num_chars = len(chars)
-
-        if index < num_chars:
-            return chars[index]
-        else:
-            # Two-character hints
-            first_idx = (index - num_chars) // num_chars
-            second_idx = (index - num_chars) % num_chars
-            if first_idx < num_chars:
-                return chars[first_idx] + chars[second_idx]
-            else:
-                # Three-character hints (rare)
-                third_idx = first_idx % num_chars
-                first_idx = first_idx // num_chars
-                return chars[first_idx] + chars[third_idx] + chars[second_idx]
+        root = _new_trie_node()
+        for i, (hint_str, widget) in enumerate(zip(self._hint_strs, self._hint_widgets)):
+            node = root
+            node[_TRIE_INDICES].add(i)
+            for char in hint_str:
+                node = node.setdefault(ord(char), _new_trie_node())
+                node[_TRIE_INDICES].add(i)
+            node[_TRIE_WIDGET] = widget
+        return root
+
+    def _create_hint_window(self, widget_or_item, hint_str, parent_origin, list_geometry):
+        """
+        Create a hint label window on top of the widget or list item.
 
-    def _create_hint_window(self, widget_or_item, hint_str):
-        """Create a hint label window on top of the widget or list item."""
+        Args:
+            widget_or_item: A widget, or a (ListCtrl, item_index) tuple
+            hint_str: The hint string to display
+            parent_origin: Screen position of the parent's client area
+            list_geometry: Per-show cache of ListCtrl row geometry
+        """
         # Calculate size based on hint string length
         hint_width = 8 + len(hint_str) * 8
         hint_height = 16
@@ -209,40 +333,34 @@ class HintOverlay:
         # Handle ListCtrl items (tuples of (ListCtrl, item_index))
         if isinstance(widget_or_item, tuple):
             list_ctrl, item_index = widget_or_item
-            # Get item rect (relative to ListCtrl client area)
-            item_rect = list_ctrl.GetItemRect(item_index)
-            # Convert item position to screen coordinates
-            item_screen_x, item_screen_y = list_ctrl.ClientToScreen((item_rect.x, item_rect.y))
-            # Get parent's client area screen position (excludes title bar)
-            parent_client_x, parent_client_y = self.parent.ClientToScreen((0, 0))
+            item_screen_x, item_screen_y, item_height = self._list_item_screen_pos(
+                list_ctrl, item_index, list_geometry
+            )
             # Position hint on the checkbox (first column)
             relative_pos = (
-                item_screen_x - parent_client_x + 5,
-                item_screen_y - parent_client_y + (item_rect.height - hint_height) // 2
+                item_screen_x - parent_origin.x + 5,
+                item_screen_y - parent_origin.y + (item_height - hint_height) // 2
             )
         else:
             # Regular widget
             pos = widget_or_item.GetScreenPosition()
             size = widget_or_item.GetSize()
-            # Get parent's client area screen position (excludes title bar)
-            parent_client_x, parent_client_y = self.parent.ClientToScreen((0, 0))
             # Center hint on the widget
             relative_pos = (
-                pos.x - parent_client_x + (size.width - hint_width) // 2,
-                pos.y - parent_client_y + (size.height - hint_height) // 2
+                pos.x - parent_origin.x + (size.width - hint_width) // 2,
+                pos.y - parent_origin.y + (size.height - hint_height) // 2
             )
 
         # Create a small panel for the hint
         hint_panel = wx.Panel(self.parent, pos=relative_pos, size=(hint_width, hint_height))
-        hint_panel.SetBackgroundColour(wx.Colour(254, 218, 49))  # Yellow (#feda31)
+        hint_panel.SetBackgroundColour(_HINT_BG)
 
         # Add centered text
         hint_text = wx.StaticText(hint_panel, label=hint_str.upper())
-        font = hint_text.GetFont()
-        font.PointSize = 9
-        font = font.Bold()
-        hint_text.SetFont(font)
-        hint_text.SetForegroundColour(wx.Colour(74, 64, 14))  # Dark brown (#4a400e)
+        if self._hint_font is None:
+            self._hint_font = _make_hint_font(hint_text)
+        hint_text.SetFont(self._hint_font)
+        hint_text.SetForegroundColour(_HINT_FG)
 
         # Center text in panel
         text_size = hint_text.GetSize()
@@ -256,15 +374,49 @@ class HintOverlay:
 
         self.hint_windows.append(hint_panel)
 
+    def _list_item_screen_pos(self, list_ctrl, item_index, list_geometry):
+        """
+        Get the screen position and height of a ListCtrl item.
+
+        In report view rows are evenly spaced, so only the top visible row is
+        measured (once per ListCtrl, cached in list_geometry) and other rows
+        are derived from it. Other views measure each item.
+
+        Returns:
+            Tuple of (screen_x, screen_y, height)
+        """
+        if list_ctrl not in list_geometry:
+            if list_ctrl.InReportView():
+                top_item = max(list_ctrl.GetTopItem(), 0)
+                top_rect = list_ctrl.GetItemRect(top_item)
+                top_x, top_y = list_ctrl.ClientToScreen((top_rect.x, top_rect.y))
+                list_geometry[list_ctrl] = (top_item, top_x, top_y, top_rect.height)
+            else:
+                list_geometry[list_ctrl] = None
+
+        geometry = list_geometry[list_ctrl]
+        if geometry is None:
+            # Get item rect (relative to ListCtrl client area)
+            item_rect = list_ctrl.GetItemRect(item_index)
+            # Convert item position to screen coordinates
+            item_x, item_y = list_ctrl.ClientToScreen((item_rect.x, item_rect.y))
+            return item_x, item_y, item_rect.height
+
+        top_item, top_x, top_y, row_height = geometry
+        return top_x, top_y + (item_index - top_item) * row_height, row_height
+
     def _update_hint_visibility(self):
         """Update visibility of hint windows based on current input."""
-        for i, hint in enumerate(self.hints):
-            if i < len(self.hint_windows):
-                window = self.hint_windows[i]
-                if hint["hint"].startswith(self.current_input):
-                    window.Show()
-                else:
-                    window.Hide()
+        new_visible = self._trie_cursor[_TRIE_INDICES]
+        if new_visible == self._visible:
+            return
+
+        # Only touch windows whose visibility actually changed
+        for i in self._visible - new_visible:
+            self.hint_windows[i].Hide()
+        for i in new_visible - self._visible:
+            self.hint_windows[i].Show()
+        self._visible = new_visible
 
     def _activate_widget(self, widget_or_item):
         """
@@ -290,32 +442,44 @@ class HintOverlay:
             return
 
         widget = widget_or_item
-        if isinstance(widget, (wx.Button, wx.BitmapButton, wx.ToggleButton)):
-            # Generate a button click event
-            event = wx.CommandEvent(wx.wxEVT_COMMAND_BUTTON_CLICKED, widget.GetId())
-            event.SetEventObject(widget)
-            widget.GetEventHandler().ProcessEvent(event)
-        elif isinstance(widget, wx.CheckBox):
-            widget.SetValue(not widget.GetValue())
-            event = wx.CommandEvent(wx.wxEVT_COMMAND_CHECKBOX_CLICKED, widget.GetId())
-            event.SetEventObject(widget)
-            widget.GetEventHandler().ProcessEvent(event)
-        elif isinstance(widget, wx.RadioButton):
-            widget.SetValue(True)
-            event = wx.CommandEvent(wx.wxEVT_COMMAND_RADIOBUTTON_SELECTED, widget.GetId())
-            event.SetEventObject(widget)
-            widget.GetEventHandler().ProcessEvent(event)
-        elif isinstance(widget, (wx.TextCtrl, wx.ComboBox, wx.SearchCtrl)):
-            # For input fields, just focus them
-            widget.SetFocus()
-        elif isinstance(widget, wx.ListCtrl):
-            widget.SetFocus()
-        elif isinstance(widget, wx.Choice):
-            widget.SetFocus()
+        widget_type = type(widget)
+        if widget_type not in self._ACTIVATORS:
+            self._resolve_activator(widget_type)
+        activator = self._ACTIVATORS[widget_type]
+        if activator is not None:
+            activator(widget)
+
+    @classmethod
+    def _resolve_activator(cls, widget_type):
+        """
+        Find the activator for a widget class not directly in _ACTIVATORS.
+
+        Walks the class MRO so subclasses of known widgets behave like their
+        base, and caches the result (None if the widget is not activatable).
+        """
+        activator = None
+        for base in widget_type.__mro__[1:]:
+            if base in cls._ACTIVATORS:
+                activator = cls._ACTIVATORS[base]
+                break
+        cls._ACTIVATORS[widget_type] = activator
 
     def _clear_hints(self):
         """Clear all hint windows."""
-        for window in self.hint_windows:
-            window.Destroy()
+        if not self.hint_windows:
+            return
+
+        # Destroy rather than hide: lingering hidden children would stop a
+        # sizer-less frame from stretching its single main panel
+        self.parent.Freeze()
+        try:
+            for window in self.hint_windows:
+                window.Destroy()
+        finally:
+            self.parent.Thaw()
         self.hint_windows = []
-        self.hints = []
+        self._hint_widgets = []
+        self._hint_strs = []
+        self._hint_trie = _new_trie_node()
+        self._trie_cursor = self._hint_trie
+        self._visible = set()
@@ -13,6 +13,10 @@ from enum import Enum
 import wx
 
 
+# Window classes treated as text inputs
+INPUT_TYPES = (wx.TextCtrl, wx.ComboBox, wx.SearchCtrl)
+
+
 class VimMode(Enum):
     """Modes for the application."""
     DEFAULT = "DEFAULT"  # Normal state, no overlay active
@@ -40,6 +44,14 @@ class VimNavigationMixin:
     # Alias for external access
     VimMode = VimMode
 
+    # Names for special keys in _get_key_string
+    _SPECIAL_KEYS = {
+        wx.WXK_ESCAPE: 'Escape',
+        wx.WXK_RETURN: 'Return',
+        wx.WXK_TAB: 'Tab',
+        wx.WXK_SPACE: 'Space',
+    }
+
     def init_vim_navigation(self):
         """Initialize vim navigation system."""
         from .hints import HintOverlay
@@ -52,6 +64,8 @@ class VimNavigationMixin:
         self.hint_overlay = HintOverlay(self)
         self.search_overlay = SearchOverlay(self)
         self.nav_helper = NavigationHelper(self)
+        # ListCtrl that ESC moves focus to when leaving an input, found lazily
+        self._escape_focus_target = None
 
         # Also expose as vim_nav for backward compatibility
         self.vim_nav = self.vim_bindings
@@ -59,6 +73,10 @@ class VimNavigationMixin:
         # Bind key events
         self.Bind(wx.EVT_CHAR_HOOK, self._on_char_hook)
 
+        # Status bar and mode text last written by _update_mode_display
+        self._mode_status_bar = None
+        self._mode_last_text = None
+
         # Optional: create status bar for mode display
         if not self.GetStatusBar():
             self.CreateStatusBar()
@@ -68,39 +86,19 @@ class VimNavigationMixin:
         """Handle character input."""
         keycode = event.GetKeyCode()
 
-        # Check if we're in an input control
-        focused = wx.Window.FindFocus()
-        is_input = isinstance(focused, (wx.TextCtrl, wx.ComboBox, wx.SearchCtrl))
-
         # ESC handling - cancels HINT/SEARCH modes, or removes focus from input
         if keycode == wx.WXK_ESCAPE:
             if self.vim_mode == VimMode.HINT:
-                self.hint_overlay.hide()
                 self.set_vim_mode(VimMode.DEFAULT)
                 return  # Consume the event
             elif self.vim_mode == VimMode.SEARCH:
                 self.search_overlay.hide()
                 self.set_vim_mode(VimMode.DEFAULT)
                 return  # Consume the event
-            elif is_input and focused:
-                # Remove focus from input field using CallLater for macOS
-                def find_focusable(window):
-                    """Find a non-input widget that can accept focus."""
-                    for child in window.GetChildren():
-                        if isinstance(child, wx.ListCtrl):
-                            return child
-                        result = find_focusable(child)
-                        if result:
-                            return result
-                    return None
-
-                def do_focus():
-                    target = find_focusable(self)
-                    if target:
-                        target.SetFocus()
-
-                # Use CallLater with small delay for macOS compatibility
-                wx.CallLater(10, do_focus)
+            elif isinstance(wx.Window.FindFocus(), INPUT_TYPES):
+                # Remove focus from input field using CallLater with small
+                # delay for macOS compatibility
+                wx.CallLater(10, self._focus_escape_target)
                 return  # Consume the event
             else:
                 # ESC does nothing in DEFAULT mode without input focus
@@ -122,7 +120,7 @@ class VimNavigationMixin:
             return
 
         # In DEFAULT mode with focus on input, let typing happen normally
-        if is_input:
+        if isinstance(wx.Window.FindFocus(), INPUT_TYPES):
             event.Skip()
             return
 
@@ -147,22 +145,34 @@ class VimNavigationMixin:
 
         event.Skip()
 
+    def _focus_escape_target(self):
+        """Move focus out of an input field to the first ListCtrl."""
+        # A destroyed window evaluates as False, so a stale target is replaced
+        if not self._escape_focus_target:
+            self._escape_focus_target = self._find_first_listctrl(self)
+        if self._escape_focus_target:
+            self._escape_focus_target.SetFocus()
+
+    @staticmethod
+    def _find_first_listctrl(window):
+        """Find the first ListCtrl below window in depth-first order."""
+        stack = list(reversed(window.GetChildren()))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, wx.ListCtrl):
+                return child
+            stack.extend(reversed(child.GetChildren()))
+        return None
+
     def _get_key_string(self, event):
         """Convert key event to string representation."""
         keycode = event.GetKeyCode()
 
         # Special keys
-        if keycode == wx.WXK_ESCAPE:
-            return 'Escape'
-        elif keycode == wx.WXK_RETURN:
-            return 'Return'
-        elif keycode == wx.WXK_TAB:
-            return 'Tab'
-        elif keycode == wx.WXK_SPACE:
-            return 'Space'
-        elif keycode == ord('/'):
-            return '/'
-        elif 32 <= keycode <= 126:  # Printable ASCII
+        key_str = self._SPECIAL_KEYS.get(keycode)
+        if key_str:
+            return key_str
+        if 32 <= keycode <= 126:  # Printable ASCII
             return chr(keycode).lower()
 
         return ''
@@ -192,12 +202,17 @@ class VimNavigationMixin:
                 mode_str = ""
 
             if status_bar.GetFieldsCount() > 1:
-                status_bar.SetStatusText(mode_str, 1)
+                # Nothing to do if this bar already shows the mode text
+                if status_bar is self._mode_status_bar and mode_str == self._mode_last_text:
+                    return
             else:
                 # Add an extra field for mode display
                 status_bar.SetFieldsCount(2)
                 status_bar.SetStatusWidths([-1, 150])
-                status_bar.SetStatusText(mode_str, 1)
+
+            status_bar.SetStatusText(mode_str, 1)
+            self._mode_status_bar = status_bar
+            self._mode_last_text = mode_str
 
     def _show_input_hints(self):
         """Show hints on input fields only (like 'i' in Surfingkeys)."""
@@ -4,6 +4,8 @@ Navigation helpers for moving between UI elements.
 
 import wx
 
+from .modes import INPUT_TYPES
+
 
 class NavigationHelper:
     """
@@ -59,7 +61,7 @@ class NavigationHelper:
         
         def find_inputs(widget):
             if widget.IsShown() and widget.IsEnabled():
-                if isinstance(widget, (wx.TextCtrl, wx.ComboBox, wx.SearchCtrl)):
+                if isinstance(widget, INPUT_TYPES):
                     self.input_fields.append(widget)
                 
                 # Traverse children
@@ -4,6 +4,8 @@ Search overlay for finding text in the application.
 
 import wx
 
+from .modes import VimMode
+
 
 class SearchOverlay:
     """
@@ -85,7 +87,6 @@ class SearchOverlay:
         # ESC to cancel
         if keycode == wx.WXK_ESCAPE:
             self.hide()
-            from .modes import VimMode
             self.parent.set_vim_mode(VimMode.DEFAULT)
             return True
         
@@ -109,7 +110,6 @@ class SearchOverlay:
     def _on_cancel(self, event):
         """Handle cancel button."""
         self.hide()
-        from .modes import VimMode
         self.parent.set_vim_mode(VimMode.DEFAULT)
     
     def _search(self, query):